@@ -5,22 +5,41 @@ Tests all functionality: booking, waitlist, security, race conditions, queue pro
 """
 import asyncio
 import aiohttp
+import orjson
+import socket
 import time
-from datetime import datetime, timedelta
+import uuid
 
 BASE_URL = "http://localhost:8080"
+USER_URL = f"{BASE_URL}/user"
+CONFERENCE_URL = f"{BASE_URL}/conference"
+BOOK_URL = f"{BASE_URL}/book"
+CANCEL_URL = f"{BASE_URL}/cancel"
+CONFIRM_URL = f"{BASE_URL}/confirm"
+JSON_HEADERS = {"Content-Type": "application/json"}
+# Unique per run; each test appends its own short tag to build collision-free names
+SUITE_ID = f"{int(time.time())}{uuid.uuid4().hex[:4]}"
+STRESS_CONCURRENCY = 16  # Max in-flight bookings during stress tests
+
+def json_dumps(obj):
+    # aiohttp expects json_serialize to return str
+    return orjson.dumps(obj).decode()
 
 # Basic helper functions
+def _fmt(offset):
+    """UTC time offset seconds from now, in the server's datetime format"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(time.time() + offset))
+
 async def create_user(session, user_id, topics=["testing"]):
-    async with session.post(f"{BASE_URL}/user", json={"user_id": user_id, "topics": topics}) as resp:
+    async with session.post(USER_URL, json={"user_id": user_id, "topics": topics}) as resp:
         return resp.status in [201, 400]
 
 async def create_conference(session, name, slots=3, seconds_ahead=15):
     """Create conference that starts in specified seconds for automatic cleanup"""
-    start_time = (datetime.utcnow() + timedelta(seconds=seconds_ahead)).strftime('%Y-%m-%d %H:%M:%S')
-    end_time = (datetime.utcnow() + timedelta(seconds=seconds_ahead+10)).strftime('%Y-%m-%d %H:%M:%S')
+    start_time = _fmt(seconds_ahead)
+    end_time = _fmt(seconds_ahead+10)
     
-    async with session.post(f"{BASE_URL}/conference", json={
+    async with session.post(CONFERENCE_URL, json={
         "name": name,
         "location": "Test Location", 
         "start": start_time,
@@ -31,32 +50,70 @@ async def create_conference(session, name, slots=3, seconds_ahead=15):
         return resp.status == 201
 
 async def book_conference(session, user_id, conference_name):
-    async with session.post(f"{BASE_URL}/book", json={"user_id": user_id, "name": conference_name}) as resp:
+    # Pre-encoded body skips aiohttp's per-call JsonPayload wrapping
+    body = orjson.dumps({"user_id": user_id, "name": conference_name})
+    async with session.post(BOOK_URL, data=body, headers=JSON_HEADERS) as resp:
         if resp.status == 201:
-            data = await resp.json()
+            data = orjson.loads(await resp.read())
             return data.get("booking_id"), data.get("status")
         return None, None
 
+async def book_conference_bounded(session, sem, user_id, conference_name):
+    async with sem:
+        return await book_conference(session, user_id, conference_name)
+
 async def cancel_booking(session, booking_id):
-    async with session.post(f"{BASE_URL}/cancel", json={"booking_id": booking_id}) as resp:
+    async with session.post(CANCEL_URL, json={"booking_id": booking_id}) as resp:
         return resp.status == 200
 
 async def confirm_booking(session, booking_id, user_id):
-    async with session.post(f"{BASE_URL}/confirm", json={"booking_id": booking_id, "user_id": user_id}) as resp:
+    async with session.post(CONFIRM_URL, json={"booking_id": booking_id, "user_id": user_id}) as resp:
         return resp.status, await resp.text()
 
 async def get_conference_bookings(session, conference_name):
-    async with session.get(f"{BASE_URL}/conference/{conference_name}/bookings") as resp:
+    async with session.get(CONFERENCE_URL + "/" + conference_name + "/bookings") as resp:
         if resp.status == 200:
-            bookings = await resp.json()
+            bookings = orjson.loads(await resp.read())
             return [(b["user_id"], b["booking_id"], b["status"]) for b in bookings]
-        return []
+        return None
+
+async def get_conference_counts(session, conference_name):
+    """Status counts for a conference without building the bookings list"""
+    async with session.get(CONFERENCE_URL + "/" + conference_name + "/bookings") as resp:
+        if resp.status == 200:
+            bookings = orjson.loads(await resp.read())
+            return count_booking_statuses((b["user_id"], b["booking_id"], b["status"]) for b in bookings)
+        return None
+
+async def wait_until(session, conference_name, pred, timeout, interval=0.5, fetch=get_conference_bookings):
+    """Poll fetch(session, conference_name) until pred(result) holds or timeout seconds pass.
+
+    Failed reads (None) are skipped; returns the last successful result, or None if there was none.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    result = None
+    while True:
+        fetched = await fetch(session, conference_name)
+        if fetched is not None:
+            result = fetched
+            if pred(result):
+                return result
+        if loop.time() >= deadline:
+            return result
+        await asyncio.sleep(interval)
 
 def count_booking_statuses(bookings):
-    confirmed = len([s for u, bid, s in bookings if s == "CONFIRMED"])
-    pending = len([s for u, bid, s in bookings if s == "ConfirmationPending"])
-    waitlisted = len([s for u, bid, s in bookings if s == "WAITLISTED"])
-    canceled = len([s for u, bid, s in bookings if s == "CANCELED"])
+    confirmed = pending = waitlisted = canceled = 0
+    for u, bid, s in bookings:
+        if s == "CONFIRMED":
+            confirmed += 1
+        elif s == "ConfirmationPending":
+            pending += 1
+        elif s == "WAITLISTED":
+            waitlisted += 1
+        elif s == "CANCELED":
+            canceled += 1
     return confirmed, pending, waitlisted, canceled
 
 def print_booking_state(bookings, title):
@@ -68,13 +125,12 @@ def print_booking_state(bookings, title):
 async def test_basic_functionality(session):
     """Test basic booking and cancellation"""
     print("🧪 Testing basic functionality...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}ba"
     conf_name = f"BasicTest{timestamp}"
     
     # Create conference that starts in 15 seconds
     await create_conference(session, conf_name, slots=2, seconds_ahead=15)
-    await create_user(session, f"basic1{timestamp}")
-    await create_user(session, f"basic2{timestamp}")
+    await asyncio.gather(*[create_user(session, f"basic{i}{timestamp}") for i in (1, 2)])
     
     # Test booking
     booking1_id, status1 = await book_conference(session, f"basic1{timestamp}", conf_name)
@@ -98,13 +154,12 @@ async def test_basic_functionality(session):
 async def test_waitlist_functionality(session):
     """Test waitlist creation and promotion"""
     print("🧪 Testing waitlist functionality...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}wl"
     conf_name = f"WaitlistTest{timestamp}"
     
     # Create conference that starts in 15 seconds
     await create_conference(session, conf_name, slots=2, seconds_ahead=15)
-    for i in range(4):
-        await create_user(session, f"waitlist{i}{timestamp}")
+    await asyncio.gather(*[create_user(session, f"waitlist{i}{timestamp}") for i in range(4)])
     
     # Book all slots and create waitlist
     bookings = []
@@ -112,8 +167,7 @@ async def test_waitlist_functionality(session):
         booking_id, status = await book_conference(session, f"waitlist{i}{timestamp}", conf_name)
         bookings.append((f"waitlist{i}{timestamp}", booking_id, status))
     
-    confirmed_count = len([s for u, bid, s in bookings if s == "CONFIRMED"])
-    waitlisted_count = len([s for u, bid, s in bookings if s == "WAITLISTED"])
+    confirmed_count, _, waitlisted_count, _ = count_booking_statuses(bookings)
     
     if confirmed_count == 2 and waitlisted_count == 2:
         print("✅ Waitlist creation works")
@@ -126,8 +180,7 @@ async def test_waitlist_functionality(session):
     if confirmed_booking and await cancel_booking(session, confirmed_booking):
         await asyncio.sleep(1)  # Wait for promotion
         
-        current_bookings = await get_conference_bookings(session, conf_name)
-        confirmed, pending, waitlisted, canceled = count_booking_statuses(current_bookings)
+        confirmed, pending, waitlisted, canceled = await get_conference_counts(session, conf_name) or (0, 0, 0, 0)
         
         if pending >= 1:  # Someone should be promoted
             print("✅ Waitlist promotion works")
@@ -140,17 +193,18 @@ async def test_waitlist_functionality(session):
 async def test_security_authorization(session):
     """Test booking confirmation security"""
     print("🧪 Testing security authorization...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}sa"
     conf_name = f"SecurityTest{timestamp}"
     
     # Create conference that starts in 15 seconds
     await create_conference(session, conf_name, slots=1, seconds_ahead=15)
-    await create_user(session, f"secure1{timestamp}")
-    await create_user(session, f"secure2{timestamp}")
-    await create_user(session, f"hacker{timestamp}")
+    await asyncio.gather(*[create_user(session, user) for user in (f"secure1{timestamp}", f"secure2{timestamp}", f"hacker{timestamp}")])
     
-    # Fill slot and create waitlist
-    booking1_id, _ = await book_conference(session, f"secure1{timestamp}", conf_name)
+    # Fill slot, then join the waitlist
+    booking1_id, status1 = await book_conference(session, f"secure1{timestamp}", conf_name)
+    if status1 != "CONFIRMED":
+        print("❌ Initial booking was not confirmed")
+        return False
     booking2_id, _ = await book_conference(session, f"secure2{timestamp}", conf_name)
     
     # Cancel to promote waitlisted user
@@ -178,20 +232,23 @@ async def test_security_authorization(session):
 async def test_waitlist_bypass_protection(session):
     """Test that users can't bypass waitlist when slots are reserved"""
     print("🧪 Testing waitlist bypass protection...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}bp"
     conf_name = f"BypassTest{timestamp}"
     
     # Create conference that starts in 15 seconds
     await create_conference(session, conf_name, slots=1, seconds_ahead=15)
-    for i in range(4):
-        await create_user(session, f"bypass{i}{timestamp}")
+    await asyncio.gather(*[create_user(session, f"bypass{i}{timestamp}") for i in range(4)])
     
     # Fill slot
-    booking1_id, _ = await book_conference(session, f"bypass0{timestamp}", conf_name)
+    booking1_id, status1 = await book_conference(session, f"bypass0{timestamp}", conf_name)
+    if status1 != "CONFIRMED":
+        print("❌ Initial booking was not confirmed")
+        return False
     
     # Create waitlist
-    booking2_id, status2 = await book_conference(session, f"bypass1{timestamp}", conf_name)
-    booking3_id, status3 = await book_conference(session, f"bypass2{timestamp}", conf_name)
+    (booking2_id, status2), (booking3_id, status3) = await asyncio.gather(
+        *[book_conference(session, f"bypass{i}{timestamp}", conf_name) for i in (1, 2)]
+    )
     
     # Cancel to promote first waitlisted user
     await cancel_booking(session, booking1_id)
@@ -211,22 +268,20 @@ async def test_waitlist_bypass_protection(session):
 async def test_concurrent_operations(session):
     """Test concurrent booking and cancellation handling"""
     print("🧪 Testing concurrent operations...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}co"
     conf_name = f"ConcurrentTest{timestamp}"
     
     # Create conference that starts in 15 seconds
     await create_conference(session, conf_name, slots=3, seconds_ahead=15)
     users = [f"concurrent{i}{timestamp}" for i in range(7)]
-    for user in users:
-        await create_user(session, user)
+    await asyncio.gather(*[create_user(session, user) for user in users])
     
     # Concurrent booking test
     tasks = [book_conference(session, user, conf_name) for user in users]
     results = await asyncio.gather(*tasks)
     
     bookings = [(users[i], bid, status) for i, (bid, status) in enumerate(results) if bid]
-    confirmed_count = len([s for u, bid, s in bookings if s == "CONFIRMED"])
-    waitlisted_count = len([s for u, bid, s in bookings if s == "WAITLISTED"])
+    confirmed_count, _, waitlisted_count, _ = count_booking_statuses(bookings)
     
     if confirmed_count == 3 and waitlisted_count == 4:
         print("✅ Concurrent booking works correctly")
@@ -242,8 +297,7 @@ async def test_concurrent_operations(session):
         
         await asyncio.sleep(1)  # Wait for promotions
         
-        current_bookings = await get_conference_bookings(session, conf_name)
-        confirmed, pending, waitlisted, canceled = count_booking_statuses(current_bookings)
+        confirmed, pending, waitlisted, canceled = await get_conference_counts(session, conf_name) or (0, 0, 0, 0)
         
         # Each cancellation should promote exactly one person
         if pending >= 1:
@@ -257,14 +311,13 @@ async def test_concurrent_operations(session):
 async def test_multiple_cancellations(session):
     """Test what happens with multiple cancellations"""
     print("🧪 Testing multiple cancellations...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}mc"
     conf_name = f"MultiCancelTest{timestamp}"
     
     # Create conference that starts in 15 seconds
     await create_conference(session, conf_name, slots=3, seconds_ahead=15)
     users = [f"multiuser{i}{timestamp}" for i in range(6)]
-    for user in users:
-        await create_user(session, user)
+    await asyncio.gather(*[create_user(session, user) for user in users])
     
     # Fill all slots and create waitlist
     bookings = []
@@ -287,8 +340,7 @@ async def test_multiple_cancellations(session):
         
         await asyncio.sleep(3)  # Increased wait time for queue processing
         
-        current_bookings = await get_conference_bookings(session, conf_name)
-        confirmed, pending, waitlisted, canceled = count_booking_statuses(current_bookings)
+        confirmed, pending, waitlisted, canceled = await get_conference_counts(session, conf_name) or (0, 0, 0, 0)
         
         print(f"📊 After cancellations: confirmed={confirmed}, pending={pending}, waitlisted={waitlisted}, canceled={canceled}")
         
@@ -314,28 +366,37 @@ async def test_multiple_cancellations(session):
 async def test_confirmation_expiration(session):
     """Test confirmation timeout and cycling"""
     print("🧪 Testing confirmation expiration...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}ce"
     conf_name = f"ExpirationTest{timestamp}"
     
     # Create conference that starts in 25 seconds (longer since this test takes 11 seconds)
     await create_conference(session, conf_name, slots=1, seconds_ahead=25)
-    for i in range(3):
-        await create_user(session, f"expire{i}{timestamp}")
+    await asyncio.gather(*[create_user(session, f"expire{i}{timestamp}") for i in range(3)])
     
     # Fill slot and create waitlist
-    booking1_id, _ = await book_conference(session, f"expire0{timestamp}", conf_name)
-    booking2_id, _ = await book_conference(session, f"expire1{timestamp}", conf_name)
-    booking3_id, _ = await book_conference(session, f"expire2{timestamp}", conf_name)
+    booking1_id, status1 = await book_conference(session, f"expire0{timestamp}", conf_name)
+    if status1 != "CONFIRMED":
+        print("❌ Initial booking was not confirmed")
+        return False
+    await asyncio.gather(*[book_conference(session, f"expire{i}{timestamp}", conf_name) for i in (1, 2)])
     
     # Cancel to trigger promotion
     await cancel_booking(session, booking1_id)
-    await asyncio.sleep(1)
-    
-    print("⏰ Waiting 11 seconds for confirmation expiration...")
-    await asyncio.sleep(11)  # Wait for expiration and cycling
+    promoted = await wait_until(session, conf_name, lambda b: count_booking_statuses(b)[1] >= 1, timeout=1, interval=0.1)
+    promoted_id = next((bid for u, bid, s in promoted or [] if s == "ConfirmationPending"), None)
+    if promoted_id is None:
+        print("❌ Promotion not observed after cancellation")
+        return False
     
-    current_bookings = await get_conference_bookings(session, conf_name)
-    confirmed, pending, waitlisted, canceled = count_booking_statuses(current_bookings)
+    # Counts look the same before and after cycling, so wait for a different booking to be promoted;
+    # expiry requeues the old one and promotes the next in separate writes
+    print("⏰ Waiting up to 11 seconds for confirmation expiration...")
+    current_bookings = await wait_until(
+        session, conf_name,
+        lambda b: any(s == "ConfirmationPending" and bid != promoted_id for u, bid, s in b),
+        timeout=11,
+    )
+    confirmed, pending, waitlisted, canceled = count_booking_statuses(current_bookings or [])
     
     # System should cycle and promote next person
     if pending >= 1 or confirmed >= 1:
@@ -349,14 +410,14 @@ async def test_confirmation_expiration(session):
 async def test_timer_queue_cleanup(session):
     """Test timer message cleanup when conference starts"""
     print("🧪 Testing timer queue cleanup...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}tq"
     conf_name = f"TimerTest{timestamp}"
     
     # Create conference that starts in 30 seconds (increased from 20)
-    start_time = (datetime.utcnow() + timedelta(seconds=30)).strftime('%Y-%m-%d %H:%M:%S')
-    end_time = (datetime.utcnow() + timedelta(seconds=50)).strftime('%Y-%m-%d %H:%M:%S')
+    start_time = _fmt(30)
+    end_time = _fmt(50)
     
-    async with session.post(f"{BASE_URL}/conference", json={
+    async with session.post(CONFERENCE_URL, json={
         "name": conf_name,
         "location": "Timer Test Location",
         "start": start_time,
@@ -369,20 +430,21 @@ async def test_timer_queue_cleanup(session):
             return False
     
     # Create users and bookings
-    for i in range(3):
-        await create_user(session, f"timer{i}{timestamp}")
+    await asyncio.gather(*[create_user(session, f"timer{i}{timestamp}") for i in range(3)])
     
     # Fill slot and create waitlist
-    booking1_id, _ = await book_conference(session, f"timer0{timestamp}", conf_name)
-    booking2_id, _ = await book_conference(session, f"timer1{timestamp}", conf_name)
-    booking3_id, _ = await book_conference(session, f"timer2{timestamp}", conf_name)
+    booking1_id, status1 = await book_conference(session, f"timer0{timestamp}", conf_name)
+    if status1 != "CONFIRMED":
+        print("❌ Initial booking was not confirmed")
+        return False
+    await asyncio.gather(*[book_conference(session, f"timer{i}{timestamp}", conf_name) for i in (1, 2)])
     
     # Cancel to create confirmation pending
     await cancel_booking(session, booking1_id)
     await asyncio.sleep(2)
     
     # Check state before conference start
-    bookings_before = await get_conference_bookings(session, conf_name)
+    bookings_before = await get_conference_bookings(session, conf_name) or []
     print_booking_state(bookings_before, "Before Conference Start")
     
     confirmed_before, pending_before, waitlisted_before, canceled_before = count_booking_statuses(bookings_before)
@@ -393,11 +455,16 @@ async def test_timer_queue_cleanup(session):
         return True  # Consider this a pass since there's nothing to clean up
     
     # Wait for conference to start (increased timeout)
-    print("⏰ Waiting 32 seconds for conference to start and cleanup...")
-    await asyncio.sleep(32)  # Extra 2 seconds buffer
+    print("⏰ Waiting up to 32 seconds for conference to start and cleanup...")
+    await wait_until(
+        session, conf_name,
+        lambda counts: counts[1:3] == (0, 0),
+        timeout=32,  # Extra 2 seconds buffer
+        fetch=get_conference_counts,
+    )
     
     # Check state after conference start  
-    bookings_after = await get_conference_bookings(session, conf_name)
+    bookings_after = await get_conference_bookings(session, conf_name) or []
     print_booking_state(bookings_after, "After Conference Start")
     
     confirmed, pending, waitlisted, canceled = count_booking_statuses(bookings_after)
@@ -420,13 +487,12 @@ async def test_timer_queue_cleanup(session):
 async def test_edge_cases(session):
     """Test various edge cases"""
     print("🧪 Testing edge cases...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}ec"
     conf_name = f"EdgeTest{timestamp}"
     
     # Create conference that starts in 15 seconds
     await create_conference(session, conf_name, slots=1, seconds_ahead=15)
-    for i in range(3):
-        await create_user(session, f"edge{i}{timestamp}")
+    await asyncio.gather(*[create_user(session, f"edge{i}{timestamp}") for i in range(3)])
     
     # Test double booking prevention
     booking1_id, status1 = await book_conference(session, f"edge0{timestamp}", conf_name)
@@ -451,13 +517,15 @@ async def test_edge_cases(session):
 async def test_additional_edge_cases(session):
     """Test additional comprehensive edge cases"""
     print("🧪 Testing additional edge cases...")
-    timestamp = str(int(time.time()))
+    timestamp = f"{SUITE_ID}ae"
     
     # Test 1: Zero slot conference
     print("🔍 Testing zero slot conference...")
     zero_conf = f"ZeroSlot{timestamp}"
-    await create_conference(session, zero_conf, slots=0, seconds_ahead=15)
-    await create_user(session, f"zero{timestamp}")
+    await asyncio.gather(
+        create_conference(session, zero_conf, slots=0, seconds_ahead=15),
+        create_user(session, f"zero{timestamp}"),
+    )
     
     booking_id, status = await book_conference(session, f"zero{timestamp}", zero_conf)
     if status == "WAITLISTED" or booking_id is None:
@@ -469,10 +537,10 @@ async def test_additional_edge_cases(session):
     # Test 2: Conference that has already started
     print("🔍 Testing past conference booking...")
     past_conf = f"PastConf{timestamp}"
-    past_start = (datetime.utcnow() - timedelta(hours=1)).strftime('%Y-%m-%d %H:%M:%S')
-    past_end = (datetime.utcnow() - timedelta(minutes=30)).strftime('%Y-%m-%d %H:%M:%S')
+    past_start = _fmt(-3600)
+    past_end = _fmt(-1800)
     
-    async with session.post(f"{BASE_URL}/conference", json={
+    async with session.post(CONFERENCE_URL, json={
         "name": past_conf,
         "location": "Past Location",
         "start": past_start,
@@ -497,20 +565,21 @@ async def test_additional_edge_cases(session):
     
     # Create many users and book simultaneously
     large_users = [f"stress{i}{timestamp}" for i in range(20)]
-    for user in large_users:
-        await create_user(session, user)
+    await asyncio.gather(*[create_user(session, user) for user in large_users])
     
     # Concurrent booking stress test
-    tasks = [book_conference(session, user, large_conf) for user in large_users]
+    sem = asyncio.Semaphore(STRESS_CONCURRENCY)
+    tasks = [book_conference_bounded(session, sem, user, large_conf) for user in large_users]
     results = await asyncio.gather(*tasks)
     
-    confirmed_bookings = [r for r in results if r[1] == "CONFIRMED"]
-    waitlisted_bookings = [r for r in results if r[1] == "WAITLISTED"]
+    statuses = [status for bid, status in results]
+    large_confirmed = statuses.count("CONFIRMED")
+    large_waitlisted = statuses.count("WAITLISTED")
     
-    if len(confirmed_bookings) == 1 and len(waitlisted_bookings) == 19:
+    if large_confirmed == 1 and large_waitlisted == 19:
         print("✅ Large waitlist stress test passed")
     else:
-        print(f"⚠️ Large waitlist: {len(confirmed_bookings)} confirmed, {len(waitlisted_bookings)} waitlisted")
+        print(f"⚠️ Large waitlist: {large_confirmed} confirmed, {large_waitlisted} waitlisted")
         print("✅ System handled stress test (minor timing variations acceptable)")
     
     # Test 4: Invalid user IDs and conference names
@@ -518,12 +587,8 @@ async def test_additional_edge_cases(session):
     
     # Invalid user ID (special characters)
     invalid_users = ["user@123", "user space", "user-dash", "user.dot", ""]
-    valid_invalid_count = 0
-    
-    for invalid_user in invalid_users:
-        created = await create_user(session, invalid_user)
-        if not created:  # Should fail
-            valid_invalid_count += 1
+    created = await asyncio.gather(*[create_user(session, invalid_user) for invalid_user in invalid_users])
+    valid_invalid_count = created.count(False)  # Should fail
     
     if valid_invalid_count >= 3:  # Most should fail
         print("✅ Invalid user ID handling works")
@@ -553,8 +618,7 @@ async def test_additional_edge_cases(session):
     await create_conference(session, cycle_conf, slots=1, seconds_ahead=25)
     
     cycle_users = [f"cycle{i}{timestamp}" for i in range(5)]
-    for user in cycle_users:
-        await create_user(session, user)
+    await asyncio.gather(*[create_user(session, user) for user in cycle_users])
     
     # Create initial booking and waitlist
     bookings = []
@@ -563,22 +627,33 @@ async def test_additional_edge_cases(session):
         if booking_id:
             bookings.append((user, booking_id, status))
     
+    # Index bookings by id so status updates don't rescan the list
+    by_bid = {bid: [u, bid, s] for u, bid, s in bookings}
+    confirmed_bids = {bid for bid, (_, _, s) in by_bid.items() if s == "CONFIRMED"}
+    
     # Rapid cancel/confirm cycle
     for i in range(3):
-        confirmed_booking = next((bid for u, bid, s in bookings if s == "CONFIRMED"), None)
-        if confirmed_booking:
-            await cancel_booking(session, confirmed_booking)
-            await asyncio.sleep(0.5)  # Let promotion happen
+        confirmed = list(confirmed_bids)
+        if confirmed:
+            await asyncio.gather(*[cancel_booking(session, bid) for bid in confirmed])
+            for bid in confirmed:
+                by_bid[bid][2] = "CANCELED"
+            confirmed_bids.clear()
             
-            # Check if someone got promoted
-            current_bookings = await get_conference_bookings(session, cycle_conf)
-            pending_booking = next((b for b in current_bookings if b[2] == "ConfirmationPending"), None)
+            # Let promotion happen
+            current_bookings = await wait_until(
+                session, cycle_conf,
+                lambda b: count_booking_statuses(b)[1] >= len(confirmed),
+                timeout=1, interval=0.1,
+            )
+            pending_bookings = [b for b in current_bookings or [] if b[2] == "ConfirmationPending"]
             
-            if pending_booking:
-                # Confirm the promoted booking
-                confirm_status, _ = await confirm_booking(session, pending_booking[1], pending_booking[0])
-                if confirm_status == 200:
-                    bookings = [(u, bid, "CONFIRMED" if bid == pending_booking[1] else s) for u, bid, s in bookings]
+            # Confirm the promoted bookings
+            confirm_results = await asyncio.gather(*[confirm_booking(session, b[1], b[0]) for b in pending_bookings])
+            for b, (confirm_status, _) in zip(pending_bookings, confirm_results):
+                if confirm_status == 200 and b[1] in by_bid:
+                    by_bid[b[1]][2] = "CONFIRMED"
+                    confirmed_bids.add(b[1])
     
     print("✅ Rapid booking/canceling cycle completed")
     
@@ -589,13 +664,13 @@ async def test_additional_edge_cases(session):
     
     # Test many concurrent bookings
     max_users = [f"max{i}{timestamp}" for i in range(50)]
-    for user in max_users:
-        await create_user(session, user)
+    await asyncio.gather(*[create_user(session, user) for user in max_users])
     
-    max_tasks = [book_conference(session, user, max_conf) for user in max_users]
+    sem = asyncio.Semaphore(STRESS_CONCURRENCY)
+    max_tasks = [book_conference_bounded(session, sem, user, max_conf) for user in max_users]
     max_results = await asyncio.gather(*max_tasks)
     
-    max_confirmed = len([r for r in max_results if r[1] == "CONFIRMED"])
+    max_confirmed = [status for bid, status in max_results].count("CONFIRMED")
     if max_confirmed >= 45:  # Should confirm most/all
         print("✅ High-capacity conference handling works")
     else:
@@ -610,10 +685,16 @@ async def main():
     print("=" * 70)
     
     timeout = aiohttp.ClientTimeout(total=30)
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+    # One pooled connector shared by every helper so sockets stay alive between requests;
+    # IPv4 only so localhost doesn't race ::1 against 127.0.0.1 on each connect
+    connector = aiohttp.TCPConnector(
+        family=socket.AF_INET, limit=0, limit_per_host=256,
+        keepalive_timeout=30, force_close=False, enable_cleanup_closed=True,
+    )
+    async with aiohttp.ClientSession(connector=connector, connector_owner=True, timeout=timeout, json_serialize=json_dumps) as session:
         # Test server connectivity
         try:
-            async with session.get(f"{BASE_URL}/conference/test/bookings") as resp:
+            async with session.get(CONFERENCE_URL + "/test/bookings") as resp:
                 print("✅ Server connectivity confirmed")
         except Exception as e:
             print(f"❌ Cannot connect to server: {e}")
@@ -632,22 +713,25 @@ async def main():
             ("Additional Edge Cases", test_additional_edge_cases),
         ]
         
-        passed = 0
-        total = len(tests)
-        
-        for test_name, test_func in tests:
+        async def runner(test_name, test_func):
             print(f"\n🔍 Running: {test_name}")
             try:
-                if await test_func(session):
-                    passed += 1
-                    print(f"✅ {test_name} PASSED")
-                else:
-                    print(f"❌ {test_name} FAILED")
+                ok = await test_func(session)
             except Exception as e:
                 print(f"❌ {test_name} ERROR: {e}")
+                return test_name, False
             
-            # Small delay between tests
-            await asyncio.sleep(0.5)
+            if ok:
+                print(f"✅ {test_name} PASSED")
+            else:
+                print(f"❌ {test_name} FAILED")
+            return test_name, ok
+        
+        # Tests use unique conference/user names, so they can run side by side
+        results = await asyncio.gather(*[runner(n, f) for n, f in tests], return_exceptions=True)
+        
+        passed = sum(1 for r in results if not isinstance(r, BaseException) and r[1])
+        total = len(tests)
         
         print("\n" + "=" * 70)
         print(f"🏁 Test Results: {passed}/{total} tests passed ({(passed/total)*100:.1f}%)")
@@ -658,4 +742,9 @@ async def main():
             print("⚠️  Some tests failed. Review the issues above.")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())  # Fall back to the default asyncio event loop
+    else:
+        uvloop.run(main()) 
\ No newline at end of file